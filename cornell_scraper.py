@@ -1,17 +1,200 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve
+import functools
+import json
+import queue
 import re
+import sqlite3
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Optional, Tuple
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
+from extract_course_codes_from_list import extract_unique_courses_from_text
+
+# Prefer lxml: it parses in C and lets every catalog field be pulled out with
+# precompiled XPath; BeautifulSoup with the pure-Python parser is the fallback
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:
+    etree = lxml_html = None
+
+# Optional persistent HTTP cache; without it every run fetches every page again
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+_COURSE_RE = re.compile(r'([A-Z]+)\s*(\d+)', re.IGNORECASE)
+_CATALOG_YEAR_RE = re.compile(r'(\d{4}-\d{4})\s+Catalog')
+_SEM_RE = re.compile(r'^(FA|SP|SU|WI)\d{2}$')
+
+# Catalog fields whose value follows a "catalog-prompt" label span, paired with
+# the class of the span that holds them
+_PROMPTED_FIELDS = (
+    ('forbidden_overlaps', 'catalog-forbid'),
+    ('distribution_requirements', 'catalog-attribute'),
+    ('prerequisites', 'catalog-precoreq'),
+    ('permission_note', 'catalog-permiss'),
+    ('when_offered', 'catalog-when-offered'),
+    ('satisfies_requirement', 'catalog-satisfies'),
+    ('last_terms_offered', 'last-terms-offered'),
+)
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class attribute includes name."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+if etree is not None:
+    # Roster pages are UTF-8; saying so up front spares lxml from sniffing the encoding
+    _LXML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+    _XP_CATALOG_NOTE = etree.XPath(f"//p[{_has_class('catalog-note')}]")
+    _XP_TITLE = etree.XPath("//a[starts-with(@id, 'dtitle-')]")
+    _XP_TITLE_FALLBACK = etree.XPath(f"//div[{_has_class('title-coursedescr')}]//a")
+    _XP_DESC = etree.XPath(f"//p[{_has_class('catalog-descr')}]")
+    _XP_OUTCOMES = etree.XPath(f"//li[{_has_class('catalog-outcome')}]")
+    _XP_PROMPTED = tuple(
+        (key, etree.XPath(f"//span[{_has_class(span_class)}]")) for key, span_class in _PROMPTED_FIELDS
+    )
+    _XP_PROMPT = etree.XPath(f".//span[{_has_class('catalog-prompt')}]")
+    _XP_TEXT = etree.XPath("descendant::text()", smart_strings=False)
+    # Text of an element minus its prompt label, without mutating the tree
+    _XP_TEXT_AFTER_PROMPT = etree.XPath(
+        f"descendant::text()[not(ancestor::span[{_has_class('catalog-prompt')}])]", smart_strings=False
+    )
+
+
+# Precompiled CSS selectors for the BeautifulSoup fallback
+_SEL_CATALOG_NOTE = soupsieve.compile('p.catalog-note')
+_SEL_TITLE = soupsieve.compile('a[id^="dtitle-"]')
+_SEL_TITLE_FALLBACK = soupsieve.compile('div.title-coursedescr a')
+_SEL_DESC = soupsieve.compile('p.catalog-descr')
+_SEL_OUTCOMES = soupsieve.compile('li.catalog-outcome')
+_SEL_PROMPTED = tuple(
+    (key, soupsieve.compile(f'span.{span_class}')) for key, span_class in _PROMPTED_FIELDS
+)
+_SEL_PROMPT = soupsieve.compile('span.catalog-prompt')
+
+
+def _first(nodes: list):
+    """Return the first node of an XPath result, or None if it is empty."""
+    return nodes[0] if nodes else None
+
+
+def _joined_text(elem, xpath) -> str:
+    """Concatenate the stripped text nodes selected by xpath, like get_text(strip=True)."""
+    return ''.join(text.strip() for text in xpath(elem))
+
+
+def _text(elem) -> str:
+    """
+    Get the stripped text of an lxml or BeautifulSoup element.
+    
+    Both backends produce the same string: each text node is stripped and the
+    pieces are concatenated, as get_text(strip=True) does.
+    
+    Args:
+        elem: lxml HtmlElement or BeautifulSoup Tag
+        
+    Returns:
+        The element's text content
+    """
+    if lxml_html is not None and isinstance(elem, lxml_html.HtmlElement):
+        return _joined_text(elem, _XP_TEXT)
+    return elem.get_text(strip=True)
+
+
+def _strip_prompt_text(elem) -> str:
+    """
+    Get the text of a BeautifulSoup element minus its catalog-prompt label.
+    
+    The tree is left untouched (no extract()), which is much cheaper than rewiring it.
+    
+    Args:
+        elem: Element holding a prompt span followed by the field value
+        
+    Returns:
+        The field value, or an empty string if the element has no prompt
+    """
+    prompt = _SEL_PROMPT.select_one(elem)
+    if prompt is None:
+        return ''
+    return _text(elem).replace(_text(prompt), '', 1).strip()
+
+class RateLimiter:
+    """Token-bucket rate limiter that can be shared between threads."""
+    
+    def __init__(self, rate: float = 4.0, burst: int = 4):
+        """
+        Initialize the limiter.
+        
+        Args:
+            rate: Sustained number of requests allowed per second
+            burst: Number of requests that may go out back to back after an idle period
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may be sent, then use up one token."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            # Going negative reserves a future slot, so waiting callers are served in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
 
 class CornellCourseScraper:
     """Scraper for Cornell University course information with extended semester fallback."""
     
     BASE_URL = "https://classes.cornell.edu/browse/roster/{}/class/{}/{}"
     
-    def __init__(self, semester: str = None, debug: bool = False):
+    # Sustained requests per second and back-to-back burst, shared by all worker threads
+    REQUEST_RATE = 4.0
+    REQUEST_BURST = 4
+    # Number of courses fetched concurrently by process_course_list
+    MAX_WORKERS = 6
+    # Fallback semesters each of those courses may probe at once; with more
+    # (--max-fallbacks above this) the extra probes queue behind other courses'
+    PROBES_PER_COURSE = 5
+    
+    # Separator between course blocks in the output file, and how many courses
+    # are buffered before each write
+    OUTPUT_SEPARATOR = "\n\n" + "=" * 80 + "\n\n"
+    WRITE_BATCH_SIZE = 256
+    
+    # Labelled fields written by format_course_output, in output order
+    _OUTPUT_FIELDS = (
+        ('prerequisites', 'Prerequisites'),
+        ('permission_note', 'Permission Note'),
+        ('forbidden_overlaps', 'Forbidden Overlaps'),
+        ('distribution_requirements', 'Distribution Requirements'),
+        ('when_offered', 'When Offered'),
+        ('satisfies_requirement', 'Satisfies Requirement'),
+        ('last_terms_offered', 'Last 4 Terms Offered'),
+    )
+    
+    # On-disk response cache (used when requests-cache is installed) and on-disk
+    # cache of parsed course information; both expire after CACHE_EXPIRY
+    CACHE_NAME = "cornell_cache.sqlite"
+    PARSED_CACHE_NAME = "cornell_parsed_cache.sqlite"
+    CACHE_EXPIRY = timedelta(days=7)
+    
+    def __init__(self, semester: str = None, debug: bool = False, use_cache: bool = True,
+                 save_html: bool = False):
         """
         Initialize the scraper.
         
@@ -19,6 +202,10 @@ class CornellCourseScraper:
             semester: Semester code (e.g., "FA25" for Fall 2025, "SP25" for Spring 2025)
                      If None, automatically determines current semester
             debug: If True, print debug information during scraping
+            use_cache: If True, keep parsed course information in an on-disk cache, and
+                       fetched pages too if requests-cache is installed, so repeated
+                       runs skip the network and the HTML parse
+            save_html: If True, save the raw HTML of every fetched page for debugging
         """
         self.debug = debug
         if semester:
@@ -28,11 +215,59 @@ class CornellCourseScraper:
             if self.debug:
                 print(f"Debug: Auto-detected semester: {self.semester}")
         
-        self.session = requests.Session()
+        if use_cache and requests_cache is not None:
+            # Catalog pages change rarely; cache "not offered" responses too so
+            # fallback probes for missing courses are free on later runs
+            self.session = requests_cache.CachedSession(
+                self.CACHE_NAME,
+                backend='sqlite',
+                expire_after=self.CACHE_EXPIRY,
+                allowable_codes=(200, 404, 410)
+            )
+        else:
+            self.session = requests.Session()
         # Add headers to appear more like a regular browser
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate'
         })
+        # Every request goes to the same host, so keep a pool of live connections
+        # and retry transient server errors instead of failing the course outright
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                        raise_on_status=False)
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=retries))
+        
+        self.limiter = RateLimiter(rate=self.REQUEST_RATE, burst=self.REQUEST_BURST)
+        # Runs the fallback semester probes; shared so close() can wait for stragglers
+        self._probe_executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS * self.PROBES_PER_COURSE)
+        
+        # Lookups already answered, keyed by (dept, number, semester). Only definitive
+        # answers are kept, so transient errors are retried on the next call
+        self._results = {}
+        # Persists those answers across runs. The connection is shared by the worker
+        # threads (shelve can't be: on Python 3.13+ it is backed by a sqlite connection
+        # bound to the opening thread), so every use is serialized by the lock
+        self._parsed_cache = None
+        if use_cache:
+            try:
+                self._parsed_cache = sqlite3.connect(self.PARSED_CACHE_NAME, check_same_thread=False)
+                self._parsed_cache.execute(
+                    "CREATE TABLE IF NOT EXISTS parsed (key TEXT PRIMARY KEY, saved_at REAL, info TEXT)"
+                )
+            except sqlite3.Error as e:
+                # e.g. a read-only working directory; the scraper works without the cache
+                print(f"Warning: Could not open {self.PARSED_CACHE_NAME} ({str(e)}), continuing without it")
+                if self._parsed_cache is not None:
+                    self._parsed_cache.close()
+                    self._parsed_cache = None
+        self._parsed_cache_lock = threading.Lock()
+        
+        # Saved pages are written by a background thread so fetching never waits on disk
+        self._html_queue = None
+        if save_html:
+            self._html_queue = queue.Queue()
+            threading.Thread(target=self._write_saved_html, daemon=True).start()
     
     @staticmethod
     def get_current_semester() -> str:
@@ -60,6 +295,7 @@ class CornellCourseScraper:
             return f"SP{year % 100:02d}"
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def get_previous_semester(semester: str, steps_back: int = 1) -> str:
         """
         Get a previous semester code by going back a specified number of semesters.
@@ -88,21 +324,120 @@ class CornellCourseScraper:
         return current
     
     @staticmethod
-    def get_fallback_semesters(semester: str, num_fallbacks: int = 3) -> List[str]:
+    @functools.lru_cache(maxsize=64)
+    def get_fallback_semesters(semester: str, num_fallbacks: int = 3) -> Tuple[str, ...]:
         """
-        Get a list of fallback semesters to check.
+        Get the fallback semesters to check.
         
         Args:
             semester: Starting semester code
             num_fallbacks: Number of previous semesters to include (default 3)
             
         Returns:
-            List of semester codes to check as fallbacks
+            Tuple of semester codes to check as fallbacks (cached, so immutable)
+        """
+        return tuple(
+            CornellCourseScraper.get_previous_semester(semester, i) for i in range(1, num_fallbacks + 1)
+        )
+    
+    def close(self):
+        """Finish writing any queued HTML pages and release the HTTP session."""
+        # Let cancelled fallback probes wind down before the cache they write to is closed
+        self._probe_executor.shutdown(wait=True)
+        if self._html_queue is not None:
+            self._html_queue.join()
+        if self._parsed_cache is not None:
+            self._parsed_cache.close()
+        self.session.close()
+    
+    def _write_saved_html(self):
+        """Background worker that writes queued (filename, content) pages to disk."""
+        while True:
+            filename, content = self._html_queue.get()
+            try:
+                with open(filename, 'wb') as f:
+                    f.write(content)
+            except OSError as e:
+                print(f"Error saving HTML to {filename}: {str(e)}")
+            finally:
+                self._html_queue.task_done()
+    
+    def clear_cache(self):
+        """Discard all cached responses and parsed results so the next lookups go to the network."""
+        if hasattr(self.session, 'cache'):
+            self.session.cache.clear()
+        self._results.clear()
+        if self._parsed_cache is not None:
+            with self._parsed_cache_lock:
+                self._parsed_cache.execute("DELETE FROM parsed")
+                self._parsed_cache.commit()
+    
+    def _recall(self, key: Tuple[str, str, str]) -> bool:
+        """
+        Check whether a definitive result for a lookup is already known.
+        
+        Unexpired results from the on-disk cache are loaded into memory on first use.
+        The cache is best-effort: if it can't be read (e.g., locked by another run),
+        the lookup simply goes to the network.
+        
+        Args:
+            key: Lookup key (dept, number, semester)
+            
+        Returns:
+            True if self._results holds an answer for key
+        """
+        if key in self._results:
+            return True
+        if self._parsed_cache is None:
+            return False
+        
+        dept, number, semester = key
+        try:
+            with self._parsed_cache_lock:
+                row = self._parsed_cache.execute(
+                    "SELECT saved_at, info FROM parsed WHERE key = ?", (f"{semester}:{dept}:{number}",)
+                ).fetchone()
+        except sqlite3.Error as e:
+            if self.debug:
+                print(f"Debug: Could not read cached result for {dept} {number} in {semester}: {str(e)}")
+            return False
+        if row is None:
+            return False
+        saved_at, info = row
+        if time.time() - saved_at >= self.CACHE_EXPIRY.total_seconds():
+            return False
+        self._results[key] = json.loads(info)
+        return True
+    
+    def _remember(self, key: Tuple[str, str, str], course_info: Optional[Dict[str, str]],
+                  persist: bool = True):
         """
-        fallbacks = []
-        for i in range(1, num_fallbacks + 1):
-            fallbacks.append(CornellCourseScraper.get_previous_semester(semester, i))
-        return fallbacks
+        Record a definitive lookup result in memory and, if enabled, on disk.
+        
+        Failing to write the on-disk cache (locked, disk full, ...) only means the
+        result is fetched again on a later run, so it is not treated as an error.
+        
+        Args:
+            key: Lookup key (dept, number, semester)
+            course_info: Parsed course information, or None if the course isn't offered
+            persist: If False, keep the result for this run only. Used for misses inferred
+                     from the page content, which a maintenance or bot-challenge page can
+                     produce too; they must not stick for CACHE_EXPIRY
+        """
+        self._results[key] = course_info
+        if persist and self._parsed_cache is not None:
+            dept, number, semester = key
+            with self._parsed_cache_lock:
+                try:
+                    self._parsed_cache.execute(
+                        "INSERT OR REPLACE INTO parsed VALUES (?, ?, ?)",
+                        (f"{semester}:{dept}:{number}", time.time(), json.dumps(course_info))
+                    )
+                    self._parsed_cache.commit()
+                except sqlite3.Error as e:
+                    self._parsed_cache.rollback()
+                    if self.debug:
+                        print(f"Debug: Could not cache result for {dept} {number} in {semester}: {str(e)}")
     
     def parse_course_code(self, course_string: str) -> Tuple[str, str]:
         """
@@ -121,7 +456,7 @@ class CornellCourseScraper:
             course_string = course_string.split(':')[0].strip()
         
         # Try to match department and number
-        match = re.match(r'([A-Z]+)\s*(\d+)', course_string, re.IGNORECASE)
+        match = _COURSE_RE.match(course_string)
         if match:
             return match.group(1).upper(), match.group(2)
         else:
@@ -140,18 +475,50 @@ class CornellCourseScraper:
         """
         try:
             dept, number = self.parse_course_code(course_code)
+        except ValueError as e:
+            print(f"Error processing {course_code} in {semester}: {str(e)}")
+            return None
+        return self._get_by_parsed(dept, number, semester)
+    
+    def _get_by_parsed(self, dept: str, number: str, semester: str,
+                       cancel: Optional[threading.Event] = None) -> Optional[Dict[str, str]]:
+        """
+        Get information for an already parsed course code in a specific semester.
+        
+        Args:
+            dept: Department code (e.g., "CS")
+            number: Course number (e.g., "1110")
+            semester: Semester code (e.g., "FA25")
+            cancel: If given and set while waiting for the rate limiter, the page
+                    isn't fetched
+            
+        Returns:
+            Dictionary with course information or None if error/not found/cancelled
+        """
+        course_code = f"{dept} {number}"
+        try:
             url = self.BASE_URL.format(semester, dept, number)
             
+            key = (dept, number, semester)
+            if self._recall(key):
+                if self.debug:
+                    print(f"Debug: Reusing earlier result for {dept} {number} in {semester}")
+                return self._results[key]
+            
             if self.debug:
                 print(f"Debug: Fetching {dept} {number} from {semester} semester")
                 print(f"Debug: URL: {url}")
             
+            self.limiter.acquire()
+            if cancel is not None and cancel.is_set():
+                return None
             response = self.session.get(url, timeout=10)
             
             # Check for 404 or 410 (course not offered this semester)
             if response.status_code in [404, 410]:
                 if self.debug:
                     print(f"Debug: Course {course_code} not offered in {semester} (HTTP {response.status_code})")
+                self._remember(key, None)
                 return None
             
             if response.status_code != 200:
@@ -159,21 +526,23 @@ class CornellCourseScraper:
                 return None
             
             # Optional: Save raw HTML for debugging
-            if self.debug:
+            if self._html_queue is not None:
                 debug_filename = f"debug_{dept}_{number}_{semester}.html"
-                with open(debug_filename, 'w', encoding='utf-8') as f:
-                    f.write(response.text)
-                print(f"Debug: Saved raw HTML to {debug_filename}")
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+                self._html_queue.put((debug_filename, response.content))
+                if self.debug:
+                    print(f"Debug: Saving raw HTML to {debug_filename}")
             
-            if self.debug:
-                print(f"Debug: Page title: {soup.title.string if soup.title else 'No title found'}")
-                print(f"Debug: Response length: {len(response.text)} characters")
+            # A short page without a catalog description is the roster's "not offered"
+            # placeholder; a byte search is far cheaper than parsing it to find that out
+            if len(response.content) < 2048 and b'catalog-descr' not in response.content:
+                if self.debug:
+                    print(f"Debug: Placeholder page for {course_code} in {semester}, skipping parse")
+                self._remember(key, None, persist=False)
+                return None
             
             # Initialize course info dictionary
             course_info = {
-                'code': f"{dept} {number}",
+                'code': course_code,
                 'title': '',
                 'description': '',
                 'catalog_year': '',
@@ -188,128 +557,161 @@ class CornellCourseScraper:
                 'semester_found': semester  # Track which semester this was found in
             }
             
-            # Get catalog year from the catalog note
-            catalog_note = soup.find('p', class_='catalog-note')
-            if catalog_note:
-                catalog_text = catalog_note.get_text(strip=True)
-                # Extract the catalog year (e.g., "2024-2025" or "2025-2026")
-                year_match = re.search(r'(\d{4}-\d{4})\s+Catalog', catalog_text)
-                if year_match:
-                    course_info['catalog_year'] = year_match.group(1)
-            
-            # Get course title - it's in the a tag with class title-coursedescr
-            title_elem = soup.find('a', id=lambda x: x and x.startswith('dtitle-'))
-            if not title_elem:
-                # Fallback: look for div with class title-coursedescr
-                title_div = soup.find('div', class_='title-coursedescr')
-                if title_div:
-                    title_elem = title_div.find('a')
-            
-            if title_elem:
-                # The title format is "CS 1110 - Introduction to Computing: A Design..."
-                # We want just the part after the dash
-                full_title = title_elem.get_text(strip=True)
-                if ' - ' in full_title:
-                    course_info['title'] = full_title.split(' - ', 1)[1]
-                else:
-                    course_info['title'] = full_title
-            
             if self.debug:
-                print(f"Debug: Found title: {course_info['title'][:50]}..." if course_info['title'] else "Debug: No title found")
+                print(f"Debug: Response length: {len(response.content)} bytes")
             
-            # Get course description - it's in a p tag with class catalog-descr
-            desc_elem = soup.find('p', class_='catalog-descr')
-            if desc_elem:
-                course_info['description'] = desc_elem.get_text(strip=True)
+            if etree is not None:
+                self._extract_with_lxml(response.content, course_info)
+            else:
+                self._extract_with_bs4(response.content, course_info)
             
             if self.debug:
+                print(f"Debug: Found title: {course_info['title'][:50]}..." if course_info['title'] else "Debug: No title found")
                 print(f"Debug: Found description: {course_info['description'][:50]}..." if course_info['description'] else "Debug: No description found")
             
-            # Get forbidden overlaps - in span with class catalog-forbid
-            forbid_elem = soup.find('span', class_='catalog-forbid')
-            if forbid_elem:
-                # Remove the prompt span and get the remaining text
-                prompt = forbid_elem.find('span', class_='catalog-prompt')
-                if prompt:
-                    prompt.extract()
-                    course_info['forbidden_overlaps'] = forbid_elem.get_text(strip=True)
-            
-            # Get distribution requirements - in span with class catalog-attribute
-            dist_elem = soup.find('span', class_='catalog-attribute')
-            if dist_elem:
-                # Remove the prompt span and get the remaining text
-                prompt = dist_elem.find('span', class_='catalog-prompt')
-                if prompt:
-                    prompt.extract()
-                    course_info['distribution_requirements'] = dist_elem.get_text(strip=True)
-            
-            # Get prerequisites - in span with class catalog-precoreq
-            prereq_elem = soup.find('span', class_='catalog-precoreq')
-            if prereq_elem:
-                # Remove the prompt span and get the remaining text
-                prompt = prereq_elem.find('span', class_='catalog-prompt')
-                if prompt:
-                    prompt.extract()
-                    course_info['prerequisites'] = prereq_elem.get_text(strip=True)
-            
-            # Get permission note - in span with class catalog-permiss
-            perm_elem = soup.find('span', class_='catalog-permiss')
-            if perm_elem:
-                # Remove the prompt span and get the remaining text
-                prompt = perm_elem.find('span', class_='catalog-prompt')
-                if prompt:
-                    prompt.extract()
-                    course_info['permission_note'] = perm_elem.get_text(strip=True)
-            
-            # Get when offered - in span with class catalog-when-offered
-            when_elem = soup.find('span', class_='catalog-when-offered')
-            if when_elem:
-                # Remove the prompt span and get the remaining text
-                prompt = when_elem.find('span', class_='catalog-prompt')
-                if prompt:
-                    prompt.extract()
-                    course_info['when_offered'] = when_elem.get_text(strip=True)
-            
-            # Get satisfies requirement - in span with class catalog-satisfies
-            satisfies_elem = soup.find('span', class_='catalog-satisfies')
-            if satisfies_elem:
-                # There's a nested span with class='catalog-prompt' containing "Satisfies Requirement"
-                # The actual text we want comes after that span
-                prompt = satisfies_elem.find('span', class_='catalog-prompt')
-                if prompt:
-                    # Remove the prompt span from its parent's contents and get the remaining text
-                    prompt.extract()
-                    satisfies_text = satisfies_elem.get_text(strip=True)
-                    course_info['satisfies_requirement'] = satisfies_text
-            
-            # Get last terms offered - in span with class last-terms-offered
-            terms_elem = soup.find('span', class_='last-terms-offered')
-            if terms_elem:
-                # Remove the prompt span and get the remaining text
-                prompt = terms_elem.find('span', class_='catalog-prompt')
-                if prompt:
-                    prompt.extract()
-                    course_info['last_terms_offered'] = terms_elem.get_text(strip=True)
-            
-            # Get learning outcomes - they're in li elements with class catalog-outcome
-            outcomes = soup.find_all('li', class_='catalog-outcome')
-            if outcomes:
-                course_info['learning_outcomes'] = [
-                    outcome.get_text(strip=True) for outcome in outcomes
-                ]
-            
             # Check if we actually found any course data
             if not course_info['title'] and not course_info['description']:
                 if self.debug:
                     print(f"Debug: No course data found on page for {course_code} in {semester}")
+                self._remember(key, None, persist=False)
                 return None
             
+            self._remember(key, course_info)
             return course_info
             
         except Exception as e:
             print(f"Error processing {course_code} in {semester}: {str(e)}")
             return None
     
+    def _extract_with_lxml(self, content: bytes, course_info: Dict) -> None:
+        """
+        Fill in course_info from a catalog page using the precompiled XPaths.
+        
+        Args:
+            content: Raw HTML of the course page
+            course_info: Course information dictionary to update in place
+        """
+        tree = lxml_html.fromstring(content, parser=_LXML_PARSER)
+        
+        if self.debug:
+            print(f"Debug: Page title: {tree.findtext('.//title') or 'No title found'}")
+        
+        # Get catalog year from the catalog note (e.g., "2024-2025 Catalog")
+        catalog_note = _first(_XP_CATALOG_NOTE(tree))
+        if catalog_note is not None:
+            year_match = _CATALOG_YEAR_RE.search(_text(catalog_note))
+            if year_match:
+                course_info['catalog_year'] = year_match.group(1)
+        
+        # Get course title, keeping just the part after "CS 1110 - "
+        title_elem = _first(_XP_TITLE(tree))
+        if title_elem is None:
+            title_elem = _first(_XP_TITLE_FALLBACK(tree))
+        if title_elem is not None:
+            full_title = _text(title_elem)
+            if ' - ' in full_title:
+                course_info['title'] = full_title.split(' - ', 1)[1]
+            else:
+                course_info['title'] = full_title
+        
+        desc_elem = _first(_XP_DESC(tree))
+        if desc_elem is not None:
+            course_info['description'] = _text(desc_elem)
+        
+        # Fields labelled by a prompt span; keep only the text that isn't the prompt
+        for key, xpath in _XP_PROMPTED:
+            elem = _first(xpath(tree))
+            if elem is not None and _XP_PROMPT(elem):
+                course_info[key] = _joined_text(elem, _XP_TEXT_AFTER_PROMPT)
+        
+        outcomes = _XP_OUTCOMES(tree)
+        if outcomes:
+            course_info['learning_outcomes'] = [_text(outcome) for outcome in outcomes]
+    
+    def _extract_with_bs4(self, content: bytes, course_info: Dict) -> None:
+        """
+        Fill in course_info from a catalog page using BeautifulSoup (used when lxml is unavailable).
+        
+        Args:
+            content: Raw HTML of the course page
+            course_info: Course information dictionary to update in place
+        """
+        soup = BeautifulSoup(content, 'html.parser', from_encoding='utf-8')
+        
+        if self.debug:
+            print(f"Debug: Page title: {soup.title.string if soup.title else 'No title found'}")
+        
+        # Get catalog year from the catalog note
+        catalog_note = _SEL_CATALOG_NOTE.select_one(soup)
+        if catalog_note:
+            catalog_text = _text(catalog_note)
+            # Extract the catalog year (e.g., "2024-2025" or "2025-2026")
+            year_match = _CATALOG_YEAR_RE.search(catalog_text)
+            if year_match:
+                course_info['catalog_year'] = year_match.group(1)
+        
+        # Get course title - it's in the a tag with class title-coursedescr
+        title_elem = _SEL_TITLE.select_one(soup)
+        if not title_elem:
+            # Fallback: look for the link inside the div with class title-coursedescr
+            title_elem = _SEL_TITLE_FALLBACK.select_one(soup)
+        
+        if title_elem:
+            # The title format is "CS 1110 - Introduction to Computing: A Design..."
+            # We want just the part after the dash
+            full_title = _text(title_elem)
+            if ' - ' in full_title:
+                course_info['title'] = full_title.split(' - ', 1)[1]
+            else:
+                course_info['title'] = full_title
+        
+        # Get course description - it's in a p tag with class catalog-descr
+        desc_elem = _SEL_DESC.select_one(soup)
+        if desc_elem:
+            course_info['description'] = _text(desc_elem)
+        
+        # Fields labelled by a prompt span; keep only the text that isn't the prompt
+        for key, selector in _SEL_PROMPTED:
+            elem = selector.select_one(soup)
+            if elem:
+                course_info[key] = _strip_prompt_text(elem)
+        
+        # Get learning outcomes - they're in li elements with class catalog-outcome
+        outcomes = _SEL_OUTCOMES.select(soup)
+        if outcomes:
+            course_info['learning_outcomes'] = [_text(outcome) for outcome in outcomes]
+    
+    def _semester_exists(self, dept: str, number: str, semester: str,
+                         cancel: Optional[threading.Event] = None) -> bool:
+        """
+        Check with a HEAD request whether a course page exists in a semester.
+        
+        Args:
+            dept: Department code (e.g., "CS")
+            number: Course number (e.g., "1110")
+            semester: Semester code (e.g., "FA25")
+            cancel: If given and set while waiting for the rate limiter, no request is sent
+            
+        Returns:
+            False if the roster reports the course as not offered (HTTP 404/410),
+            True otherwise, including when the probe itself fails or is cancelled
+        """
+        url = self.BASE_URL.format(semester, dept, number)
+        try:
+            self.limiter.acquire()
+            # A superseded probe may have slept on the limiter; don't spend the token
+            if cancel is not None and cancel.is_set():
+                return True
+            response = self.session.head(url, timeout=5, allow_redirects=True)
+        except requests.RequestException as e:
+            if self.debug:
+                print(f"Debug: HEAD probe failed for {dept} {number} in {semester}: {str(e)}")
+            return True
+        
+        if self.debug:
+            print(f"Debug: HEAD {url} -> HTTP {response.status_code}")
+        return response.status_code not in [404, 410]
+    
     def get_course_info(self, course_code: str, use_fallback: bool = True, max_fallbacks: int = 3) -> Optional[Dict[str, str]]:
         """
         Get information for a single course, with extended semester fallback.
@@ -322,8 +724,32 @@ class CornellCourseScraper:
         Returns:
             Dictionary with course information or None if error
         """
+        # The code is the same for every semester, so parse it only once
+        try:
+            dept, number = self.parse_course_code(course_code)
+        except ValueError as e:
+            print(f"Error processing {course_code}: {str(e)}")
+            return None
+        return self._get_course_info_parsed(dept, number, use_fallback, max_fallbacks)
+    
+    def _get_course_info_parsed(self, dept: str, number: str, use_fallback: bool = True,
+                                max_fallbacks: int = 3) -> Optional[Dict[str, str]]:
+        """
+        Get information for an already parsed course code, with extended semester fallback.
+        
+        Args:
+            dept: Department code (e.g., "CS")
+            number: Course number (e.g., "1110")
+            use_fallback: If True, try previous semesters if not found in current
+            max_fallbacks: Maximum number of previous semesters to check (default 3)
+            
+        Returns:
+            Dictionary with course information or None if error
+        """
+        course_code = f"{dept} {number}"
+        
         # Try the current/specified semester first
-        course_info = self.get_course_info_for_semester(course_code, self.semester)
+        course_info = self._get_by_parsed(dept, number, self.semester)
         
         if course_info:
             if self.debug:
@@ -333,26 +759,67 @@ class CornellCourseScraper:
         # If not found and fallback is enabled, try previous semesters
         if use_fallback:
             fallback_semesters = self.get_fallback_semesters(self.semester, max_fallbacks)
-            checked_semesters = [self.semester]
+            if self.debug:
+                print(f"Debug: {course_code} not found in {self.semester}, trying {', '.join(fallback_semesters)}")
             
-            for fallback_semester in fallback_semesters:
-                if self.debug:
-                    print(f"Debug: {course_code} not found in {checked_semesters[-1]}, trying {fallback_semester}")
-                
-                course_info = self.get_course_info_for_semester(course_code, fallback_semester)
-                checked_semesters.append(fallback_semester)
-                
-                if course_info:
-                    print(f"Note: {course_code} found in {fallback_semester} (checked {', '.join(checked_semesters[:-1])} first)")
-                    return course_info
+            # Probe all fallback semesters at once, then take the most recent one that has
+            # the course; a miss costs one round trip instead of one per semester
+            cancel = threading.Event()
+            futures = [
+                self._probe_executor.submit(self._probe_semester, dept, number, fallback_semester, cancel)
+                for fallback_semester in fallback_semesters
+            ]
+            try:
+                for i, future in enumerate(futures):
+                    course_info = future.result()
+                    if course_info:
+                        checked_semesters = [self.semester, *fallback_semesters[:i]]
+                        print(f"Note: {course_code} found in {fallback_semesters[i]} (checked {', '.join(checked_semesters)} first)")
+                        return course_info
+            finally:
+                # Don't hold up the result waiting on probes of older semesters, but stop
+                # them before they spend more requests (and rate limiter tokens)
+                cancel.set()
+                for future in futures:
+                    future.cancel()
             
             # If we get here, course wasn't found in any semester
+            checked_semesters = [self.semester, *fallback_semesters]
             print(f"Warning: {course_code} has not been offered in: {', '.join(checked_semesters)}")
             print(f"No record found for {course_code} in the last {len(checked_semesters)} semesters")
             return None
         
         return None
     
+    def _probe_semester(self, dept: str, number: str, semester: str,
+                        cancel: threading.Event) -> Optional[Dict[str, str]]:
+        """
+        Look up a fallback semester, skipping the download when a HEAD probe rules it out.
+        
+        Args:
+            dept: Department code (e.g., "CS")
+            number: Course number (e.g., "1110")
+            semester: Semester code (e.g., "FA24")
+            cancel: Set once the result is no longer needed (a more recent semester
+                    had the course); checked before and after each wait for the rate limiter
+            
+        Returns:
+            Dictionary with course information or None if error/not found/cancelled
+        """
+        key = (dept, number, semester)
+        if cancel.is_set():
+            return None
+        try:
+            if not self._recall(key) and not self._semester_exists(dept, number, semester, cancel):
+                self._remember(key, None)
+                return None
+        except Exception as e:
+            print(f"Error processing {dept} {number} in {semester}: {str(e)}")
+            return None
+        if cancel.is_set():
+            return None
+        return self._get_by_parsed(dept, number, semester, cancel)
+    
     def format_course_output(self, course_info: Dict[str, str], include_semester_note: bool = False) -> str:
         """
         Format course information for output.
@@ -366,7 +833,8 @@ class CornellCourseScraper:
         """
         if not course_info:
             return "Course information not available"
-            
+        
+        get = course_info.get
         output = []
         output.append(course_info['code'])
         output.append(course_info['title'])
@@ -376,8 +844,9 @@ class CornellCourseScraper:
             output.append(f"[Information from {course_info['semester_found']} Class Roster]")
         
         # Add catalog year if available
-        if course_info.get('catalog_year'):
-            output.append(f"Course information provided by the {course_info['catalog_year']} Catalog.")
+        catalog_year = get('catalog_year')
+        if catalog_year:
+            output.append(f"Course information provided by the {catalog_year} Catalog.")
         else:
             output.append("Course information provided by the Catalog.")
         output.append("")  # Blank line
@@ -387,43 +856,19 @@ class CornellCourseScraper:
             output.append(f"Course Description:")
             output.append(course_info['description'])
         
-        # Add prerequisites if present
-        if course_info.get('prerequisites'):
-            output.append(f"Prerequisites: {course_info['prerequisites']}")
-        
-        # Add permission note if present
-        if course_info.get('permission_note'):
-            output.append(f"Permission Note: {course_info['permission_note']}")
-        
-        # Add forbidden overlaps if present
-        if course_info.get('forbidden_overlaps'):
-            output.append(f"Forbidden Overlaps: {course_info['forbidden_overlaps']}")
-        
-        # Add distribution requirements if present
-        if course_info.get('distribution_requirements'):
-            output.append(f"Distribution Requirements: {course_info['distribution_requirements']}")
-        
-        # Add when offered if present
-        if course_info.get('when_offered'):
-            output.append(f"When Offered: {course_info['when_offered']}")
-        
-        # Add satisfies requirement if present
-        if course_info.get('satisfies_requirement'):
-            output.append(f"Satisfies Requirement: {course_info['satisfies_requirement']}")
-        
-        # Add last terms offered if present
-        if course_info.get('last_terms_offered'):
-            output.append(f"Last 4 Terms Offered: {course_info['last_terms_offered']}")
+        # Add each labelled field that is present
+        output.extend(f"{label}: {value}" for key, label in self._OUTPUT_FIELDS if (value := get(key)))
         
         # Add learning outcomes if present
-        if course_info.get('learning_outcomes'):
+        outcomes = get('learning_outcomes')
+        if outcomes:
             output.append("Learning Outcomes:")
-            for outcome in course_info['learning_outcomes']:
-                output.append(f"* {outcome}")
+            output.extend(f"* {outcome}" for outcome in outcomes)
         
         return '\n'.join(output)
     
-    def process_course_list(self, input_file: str, output_file: str, use_fallback: bool = True, max_fallbacks: int = 3):
+    def process_course_list(self, input_file: str, output_file: str, use_fallback: bool = True, max_fallbacks: int = 3,
+                            extract_codes: bool = False):
         """
         Process a list of courses from a file and write results to output file.
         
@@ -432,12 +877,34 @@ class CornellCourseScraper:
             output_file: Path to output file for results
             use_fallback: If True, try previous semesters if not found in current
             max_fallbacks: Maximum number of previous semesters to check (default 3)
+            extract_codes: If True, input_file is free text (e.g., a pasted degree
+                audit) and its unique course codes are extracted in memory, instead
+                of running extract_course_codes_from_list.py to make an intermediate file
         """
         try:
             with open(input_file, 'r') as f:
-                courses = [line.strip() for line in f if line.strip()]
+                if extract_codes:
+                    courses = extract_unique_courses_from_text(f.read())
+                else:
+                    courses = [line.strip() for line in f if line.strip()]
+            
+            # Validate every code before any network traffic, so malformed lines are
+            # reported immediately instead of after the lookups
+            parsed = {}
+            for i, course_code in enumerate(courses):
+                try:
+                    parsed[i] = self.parse_course_code(course_code)
+                except ValueError as e:
+                    print(f"Error: {str(e)} (skipping)")
             
-            print(f"Processing {len(courses)} courses...")
+            # Look up each distinct course once, however it was spelled ("CS 1110",
+            # "CS1110"), and give every line that names it the same result
+            lines_by_course = {}
+            for i, course in parsed.items():
+                lines_by_course.setdefault(course, []).append(i)
+            
+            # Progress counts distinct courses; the final summary counts input lines
+            print(f"Processing {len(lines_by_course)} distinct courses from {len(courses)} lines...")
             print(f"Current semester: {self.semester}")
             if use_fallback:
                 fallback_semesters = self.get_fallback_semesters(self.semester, max_fallbacks)
@@ -446,41 +913,71 @@ class CornellCourseScraper:
             
             successful = 0
             failed = []
+            all_semesters = (self.semester,) + self.get_fallback_semesters(self.semester, max_fallbacks)
+            all_semesters_str = ', '.join(all_semesters)
+            results = dict.fromkeys(range(len(courses)))
             
-            with open(output_file, 'w', encoding='utf-8') as out:
-                for i, course_code in enumerate(courses, 1):
-                    print(f"\nProcessing {i}/{len(courses)}: {course_code}")
-                    
-                    course_info = self.get_course_info(course_code, use_fallback=use_fallback, max_fallbacks=max_fallbacks)
+            # Courses are independent, so fetch them concurrently; politeness to the
+            # server is enforced by the shared rate limiter, not per course
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._get_course_info_parsed, dept, number, use_fallback, max_fallbacks): indexes
+                    for (dept, number), indexes in lines_by_course.items()
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    indexes = futures[future]
+                    # One failing course must not take the finished results down with it
+                    try:
+                        course_info = future.result()
+                    except Exception as e:
+                        print(f"Error processing {courses[indexes[0]]}: {str(e)}")
+                        course_info = None
+                    for index in indexes:
+                        results[index] = course_info
+                    print(f"\nProcessed course {done}/{len(futures)}: {courses[indexes[0]]}")
                     
                     if course_info:
-                        formatted = self.format_course_output(course_info, include_semester_note=True)
-                        out.write(formatted)
-                        out.write("\n\n" + "="*80 + "\n\n")
-                        successful += 1
-                        
                         # Note if found in different semester
                         if 'semester_found' in course_info and course_info['semester_found'] != self.semester:
                             print(f"  → Found in {course_info['semester_found']} (not in {self.semester})")
                         else:
                             print(f"  → Successfully processed")
                     else:
-                        all_semesters = [self.semester] + self.get_fallback_semesters(self.semester, max_fallbacks)
-                        error_msg = f"{course_code} has not been offered in: {', '.join(all_semesters)}"
-                        out.write(f"{course_code}\n")
-                        out.write(f"[Course not found]\n")
-                        out.write(f"Course information provided by the Catalog.\n\n")
-                        out.write(f"Error: {error_msg}\n\n")
-                        out.write("="*80 + "\n\n")
-                        failed.append(course_code)
                         print(f"  → Not found in any of the last {len(all_semesters)} semesters")
+            
+            # Write results in the original input order, joining blocks so the file
+            # sees one write per batch instead of several per course
+            chunks = []
+            with open(output_file, 'w', encoding='utf-8') as out:
+                for index, course_code in enumerate(courses):
+                    course_info = results[index]
                     
-                    # Be polite to the server - add a small delay between requests
-                    time.sleep(0.5)
+                    if course_info:
+                        chunks.append(self.format_course_output(course_info, include_semester_note=True))
+                        successful += 1
+                    else:
+                        if index in parsed:
+                            error_msg = f"{course_code} has not been offered in: {all_semesters_str}"
+                        else:
+                            error_msg = f"Could not parse course code: {course_code}"
+                        chunks.append(
+                            f"{course_code}\n"
+                            f"[Course not found]\n"
+                            f"Course information provided by the Catalog.\n\n"
+                            f"Error: {error_msg}"
+                        )
+                        failed.append(course_code)
+                    chunks.append(self.OUTPUT_SEPARATOR)
+                    
+                    if (index + 1) % self.WRITE_BATCH_SIZE == 0:
+                        out.write(''.join(chunks))
+                        chunks.clear()
+                
+                out.write(''.join(chunks))
             
             print("\n" + "="*50)
             print(f"Completed! Results written to {output_file}")
-            print(f"Successfully processed: {successful}/{len(courses)} courses")
+            print(f"Successfully processed: {successful}/{len(courses)} lines")
             if failed:
                 print(f"Failed to find: {', '.join(failed)}")
             
@@ -547,6 +1044,7 @@ def main():
     
     # Process the courses
     scraper.process_course_list("courses_input.txt", "courses_output.txt")
+    scraper.close()
 
 
 if __name__ == "__main__":
@@ -554,10 +1052,12 @@ if __name__ == "__main__":
     if len(sys.argv) == 1:
         # No arguments, run demo
         main()
-    elif len(sys.argv) >= 2 and not sys.argv[1].startswith("--"):
-        # Single course query
+    elif (len(sys.argv) >= 2 and not sys.argv[1].startswith("--")) or (len(sys.argv) >= 3 and sys.argv[1] == "--file"):
         debug = "--debug" in sys.argv
+        save_html = "--save-html" in sys.argv
         no_fallback = "--no-fallback" in sys.argv
+        use_cache = "--no-cache" not in sys.argv
+        extract_codes = "--extract" in sys.argv
         
         # Check for max fallbacks override
         max_fallbacks = 3  # Default
@@ -575,55 +1075,43 @@ if __name__ == "__main__":
                 semester = sys.argv[i + 1]
                 break
         
-        scraper = CornellCourseScraper(semester=semester, debug=debug)
-        course_info = scraper.get_course_info(sys.argv[1], use_fallback=not no_fallback, max_fallbacks=max_fallbacks)
+        # One scraper (and so one pooled session) serves the whole invocation
+        scraper = CornellCourseScraper(semester=semester, debug=debug, use_cache=use_cache, save_html=save_html)
+        if "--refresh" in sys.argv:
+            scraper.clear_cache()
         
-        if course_info:
-            print(scraper.format_course_output(course_info, include_semester_note=True))
+        if sys.argv[1] != "--file":
+            # Single course query
+            course_info = scraper.get_course_info(sys.argv[1], use_fallback=not no_fallback, max_fallbacks=max_fallbacks)
+            
+            if course_info:
+                print(scraper.format_course_output(course_info, include_semester_note=True))
+            else:
+                print(f"Failed to retrieve information for {sys.argv[1]}")
         else:
-            print(f"Failed to retrieve information for {sys.argv[1]}")
-    elif len(sys.argv) >= 3 and sys.argv[1] == "--file":
-        # File processing mode
-        debug = "--debug" in sys.argv
-        no_fallback = "--no-fallback" in sys.argv
-        
-        # Check for max fallbacks override
-        max_fallbacks = 3  # Default
-        for i, arg in enumerate(sys.argv):
-            if arg == "--max-fallbacks" and i + 1 < len(sys.argv):
-                try:
-                    max_fallbacks = int(sys.argv[i + 1])
-                except ValueError:
-                    print(f"Warning: Invalid max-fallbacks value '{sys.argv[i + 1]}', using default (3)")
-        
-        # Check for semester override
-        semester = None
-        for i, arg in enumerate(sys.argv):
-            if arg == "--semester" and i + 1 < len(sys.argv):
-                semester = sys.argv[i + 1]
-                break
-        
-        scraper = CornellCourseScraper(semester=semester, debug=debug)
-        
-        input_file = sys.argv[2]
-        # Find output file (skip flags and semester codes)
-        output_file = None
-        skip_next = False
-        for i, arg in enumerate(sys.argv[3:], start=3):
-            if skip_next:
-                skip_next = False
-                continue
-            if arg in ["--semester", "--max-fallbacks"]:
-                skip_next = True
-                continue
-            if not arg.startswith("--") and not re.match(r'^(FA|SP|SU|WI)\d{2}$', arg):
-                output_file = arg
-                break
-        
-        if not output_file:
-            output_file = "courses_output.txt"
+            # File processing mode
+            input_file = sys.argv[2]
+            # Find output file (skip flags and semester codes)
+            output_file = None
+            skip_next = False
+            for i, arg in enumerate(sys.argv[3:], start=3):
+                if skip_next:
+                    skip_next = False
+                    continue
+                if arg in ["--semester", "--max-fallbacks"]:
+                    skip_next = True
+                    continue
+                if not arg.startswith("--") and not _SEM_RE.match(arg):
+                    output_file = arg
+                    break
+            
+            if not output_file:
+                output_file = "courses_output.txt"
+            
+            scraper.process_course_list(input_file, output_file, use_fallback=not no_fallback, max_fallbacks=max_fallbacks,
+                                        extract_codes=extract_codes)
         
-        scraper.process_course_list(input_file, output_file, use_fallback=not no_fallback, max_fallbacks=max_fallbacks)
+        scraper.close()
     else:
         print("Cornell Course Scraper (Extended Fallback)")
         print("="*50)
@@ -634,9 +1122,13 @@ if __name__ == "__main__":
         print()
         print("Options:")
         print("  --debug              Show detailed debug information")
+        print("  --save-html          Save the raw HTML of each fetched page")
         print("  --no-fallback        Don't check previous semesters if not found")
         print("  --semester TERM      Override semester (e.g., FA25, SP26)")
         print("  --max-fallbacks N    Maximum number of previous semesters to check (default: 3)")
+        print("  --refresh            Clear the on-disk caches before fetching")
+        print("  --no-cache           Don't read or write the on-disk caches")
+        print("  --extract            Treat the --file input as free text and pull out its unique course codes")
         print()
         print("Examples:")
         print("  python script.py 'CS 1110'")
@@ -644,6 +1136,7 @@ if __name__ == "__main__":
         print("  python script.py 'INFO 4120' --max-fallbacks 5")
         print("  python script.py --file courses.txt results.txt")
         print("  python script.py --file courses.txt --semester SP25 --debug")
+        print("  python script.py --file audit.txt results.txt --extract")
         print()
         current = CornellCourseScraper.get_current_semester()
         fallbacks = CornellCourseScraper.get_fallback_semesters(current, 3)
@@ -1,4 +1,123 @@
+import contextlib
+import hashlib
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+# xxhash is optional; it only speeds up the unchanged-input check
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Regex to find patterns like 'DEPT 1234' (e.g., 'INFO 3450', 'CS 4740')
+# [A-Z]{2,7} matches the 2-7 uppercase letters of the department code; the bound
+# keeps long runs of capitals (acronyms, headings) from backtracking.
+# \d{4} matches exactly four digits for the course number.
+# \b on both ends rejects codes glued to other words or longer numbers.
+_COURSE_RE = re.compile(rb'\b[A-Z]{2,7} \d{4}\b')
+
+# Inputs at least this large are split into shards and scanned by one process
+# per CPU; below it, starting the workers costs more than the scan itself
+_PARALLEL_THRESHOLD = 32 << 20
+
+def _collect_courses(buffer, start=0, end=None):
+    """
+    Finds the unique course codes in a bytes-like buffer.
+
+    Args:
+        buffer (bytes-like): Data to scan (bytes, mmap, ...).
+        start (int): Offset to start scanning at.
+        end (int, optional): Offset to stop scanning at (default: end of buffer).
+
+    Returns:
+        set of bytes: The unique course codes found.
+    """
+    if end is None:
+        end = len(buffer)
+    # findall collects every match inside the regex engine's C loop, with no
+    # Python code run per match
+    return set(_COURSE_RE.findall(buffer, start, end))
+
+def _scan_shard(input_file_path, start, end):
+    """Worker for _collect_courses_parallel: scans bytes [start, end) of the file."""
+    with open(input_file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return _collect_courses(content, start, end)
+
+def _collect_courses_parallel(input_file_path, content, workers):
+    """
+    Finds the unique course codes in a large file using several processes.
+
+    The file is cut into one shard per worker, each ending just after a
+    newline. Codes never span lines, so no code is split between shards.
+
+    Args:
+        input_file_path (str): The path to the file, reopened by each worker.
+        content (mmap): A memory map of the same file, used to place the cuts.
+        workers (int): The number of processes to use.
+
+    Returns:
+        set of bytes: The unique course codes found.
+    """
+    size = len(content)
+    bounds = [0]
+    for i in range(1, workers):
+        cut = content.find(b'\n', size * i // workers)
+        if cut == -1:
+            break
+        if cut + 1 > bounds[-1]:
+            bounds.append(cut + 1)
+    bounds.append(size)
+
+    with ProcessPoolExecutor(max_workers=len(bounds) - 1) as executor:
+        shards = executor.map(_scan_shard, repeat(input_file_path), bounds[:-1], bounds[1:])
+        return set().union(*shards)
+
+def _digest(*parts):
+    """Hash a sequence of bytes-like parts (xxh3 if xxhash is installed, else BLAKE2b)."""
+    hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    for part in parts:
+        hasher.update(part)
+    return hasher.hexdigest()
+
+def _is_up_to_date(output_file_path, hash_path, input_digest):
+    """
+    Checks whether a previous run already wrote the output for this input.
+
+    The sidecar file holds the digest of the input (and pattern) and of the
+    output written for it. Both must match, so an output that was edited or
+    only partly written is regenerated.
+
+    Returns:
+        bool: True if the output file can be left as it is.
+    """
+    try:
+        with open(hash_path) as file:
+            saved_input_digest, saved_output_digest = file.read().split()
+        with open(output_file_path, 'rb') as file:
+            output_digest = _digest(file.read())
+    except (FileNotFoundError, ValueError):
+        return False
+    return saved_input_digest == input_digest and saved_output_digest == output_digest
+
+def extract_unique_courses_from_text(text):
+    """
+    Extracts unique course codes from a string and returns them sorted.
+
+    Lets other code (such as the scraper) pull codes out of text it already
+    has in memory, without writing it to a file and reading it back.
+
+    Args:
+        text (str): The text to search.
+
+    Returns:
+        list of str: The sorted, unique course codes.
+    """
+    found_courses = _collect_courses(text.encode('utf-8'))
+    return [code.decode('ascii') for code in sorted(found_courses)]
 
 def extract_unique_courses(input_file_path, output_file_path):
     """
@@ -8,39 +127,56 @@ def extract_unique_courses(input_file_path, output_file_path):
     Args:
         input_file_path (str): The path to the text file to read from.
         output_file_path (str): The path to the text file to write to.
+
+    If the input and pattern are unchanged since the last run (checked with
+    the hashes in output_file_path + '.hash'), the existing output is kept
+    and nothing is scanned or written.
     """
+    hash_path = output_file_path + '.hash'
+
+    # Scan a read-only memory map of the file: the OS pages it in on demand, so
+    # the regex reads the page cache directly instead of a copy of the whole file.
+    # mmap can't map an empty file, but an empty file has no codes anyway.
+    workers = os.cpu_count() or 1
     try:
-        with open(input_file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
+        with open(input_file_path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else contextlib.nullcontext(b'') as content:
+                # The pattern is hashed too, so changing it invalidates old outputs
+                input_digest = _digest(_COURSE_RE.pattern, b'\0', content)
+                if _is_up_to_date(output_file_path, hash_path, input_digest):
+                    print(f"'{input_file_path}' is unchanged; '{output_file_path}' is already up to date.")
+                    return
+                if size >= _PARALLEL_THRESHOLD and workers > 1:
+                    found_courses = _collect_courses_parallel(input_file_path, content, workers)
+                else:
+                    found_courses = _collect_courses(content)
     except FileNotFoundError:
         print(f"Error: The file '{input_file_path}' was not found.")
         return
-
-    # Regex to find patterns like 'DEPT 1234' (e.g., 'INFO 3450', 'CS 4740')
-    # [A-Z]+ matches one or more uppercase letters for the department code.
-    # \d{4} matches exactly four digits for the course number.
-    course_code_pattern = r'[A-Z]+ \d{4}'
-    
-    # Find all occurrences matching the pattern
-    found_courses = re.findall(course_code_pattern, content)
     
-    # Use a set to get unique course codes and then convert back to a list
-    unique_courses = sorted(list(set(found_courses)))
+    # Sort the unique course codes
+    unique_courses = sorted(found_courses)
     
     # Write the sorted, unique course codes to the output file
-    with open(output_file_path, 'w', encoding='utf-8') as file:
-        for course in unique_courses:
-            file.write(course + '\n')
+    # (joined into a single buffer so the whole list is one write call)
+    output = b'\n'.join(unique_courses) + b'\n' if unique_courses else b''
+    with open(output_file_path, 'wb') as file:
+        file.write(output)
+    # Record the hashes last, so an interrupted write is never mistaken for current
+    with open(hash_path, 'w') as file:
+        file.write(f"{input_digest}\n{_digest(output)}\n")
             
     print(f"Successfully extracted {len(unique_courses)} unique course codes.")
     print(f"Results have been saved to '{output_file_path}'.")
 
-# --- Execution ---
-# Name of the file containing the course list
-input_filename = 'input_courses.txt'
+if __name__ == "__main__":
+    # --- Execution ---
+    # Name of the file containing the course list
+    input_filename = 'input_courses.txt'
 
-# Name for the new file that will be created
-output_filename = 'unique_courses.txt'
+    # Name for the new file that will be created
+    output_filename = 'unique_courses.txt'
 
-# Run the function
-extract_unique_courses(input_filename, output_filename)
\ No newline at end of file
+    # Run the function
+    extract_unique_courses(input_filename, output_filename)